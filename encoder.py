@@ -3,6 +3,8 @@ Custom encoder for the customer churn predictor model.
 
 Exports:
   ENCODER_CONFIG — EncoderConfig with semantic + metrics layers
+  LAYERS — {layer_name: Layer} index into ENCODER_CONFIG
+  ROLES — {(layer, segment, role): Role} index into ENCODER_CONFIG
   encode_query(query) — converts NL text to a Concept for similarity search
   assess_query(query) — checks query has enough signal (returns ASK if too vague)
   entry_to_record(entry) — converts a JSONL exemplar to an encodable record
@@ -23,8 +25,8 @@ Architecture:
   Temporal: customer_id is key_part with auto timestamps for daily drift tracking.
 """
 
-import hashlib
-import re
+import zlib
+from functools import lru_cache
 
 from glyphh.core.config import (
     EncoderConfig,
@@ -136,20 +138,38 @@ ENCODER_CONFIG = EncoderConfig(
 )
 
 
+LAYERS = {layer.name: layer for layer in ENCODER_CONFIG.layers}
+
+ROLES = {
+    (layer.name, segment.name, role.name): role
+    for layer in ENCODER_CONFIG.layers
+    for segment in layer.segments
+    for role in segment.roles
+}
+
+
 # ---------------------------------------------------------------------------
 # encode_query — NL text → Concept dict
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1024)
+def _query_name_and_keywords(query: str) -> tuple[str, str]:
+    """Memoized (concept name, expanded keywords) for a query string."""
+    stable_id = zlib.crc32(query.encode())
+    return f"query_{stable_id:08d}", extract_keywords(query)
+
+
 def encode_query(query: str) -> dict:
     """Convert a raw NL query about churn into a Concept-compatible dict.
 
     Encodes text into the semantic layer (description + keywords).
     No numeric values — query matching is text-driven.
     Risk/driver labels are outcomes of similarity, not inputs.
-    """
-    keywords = extract_keywords(query)
 
-    stable_id = int(hashlib.md5(query.encode()).hexdigest()[:8], 16)
+    Text processing is cached per query; the returned dict is always
+    fresh so callers may mutate it.
+    """
+    name, keywords = _query_name_and_keywords(query)
 
     # Use expanded keywords for BOTH description and keywords roles.
     # For NL queries, the raw query text adds noise to description BoW
@@ -157,7 +177,7 @@ def encode_query(query: str) -> dict:
     # carry the actual domain signal. Doubling down on keywords via
     # both roles gives consistent, vocabulary-driven matching.
     return {
-        "name": f"query_{stable_id:08d}",
+        "name": name,
         "attributes": {
             "customer_id": "",
             "description": keywords,
@@ -170,6 +190,10 @@ def encode_query(query: str) -> dict:
 # entry_to_record — JSONL exemplar → encodable record + metadata
 # ---------------------------------------------------------------------------
 
+# Numeric usage fields, copied into both attributes (encoded) and metadata
+_METRIC_FIELDS = ("logins", "support_cases", "defects", "feature_adoption")
+
+
 def entry_to_record(entry: dict) -> dict:
     """Convert a JSONL exemplar to an encodable record with metadata.
 
@@ -180,8 +204,7 @@ def entry_to_record(entry: dict) -> dict:
     customer_id = entry.get("customer_id", "")
     kw_list = entry.get("keywords", [])
     kw_str = " ".join(kw_list) if isinstance(kw_list, list) else str(kw_list)
-
-    slug = re.sub(r"[^a-z0-9]+", "_", question.lower()).strip("_")[:40]
+    metrics = {field: entry.get(field, 0) for field in _METRIC_FIELDS}
 
     return {
         "concept_text": question,
@@ -189,10 +212,7 @@ def entry_to_record(entry: dict) -> dict:
             "customer_id": customer_id,
             "description": preprocess(question),
             "keywords": kw_str,
-            "logins": entry.get("logins", 0),
-            "support_cases": entry.get("support_cases", 0),
-            "defects": entry.get("defects", 0),
-            "feature_adoption": entry.get("feature_adoption", 0),
+            **metrics,
         },
         "metadata": {
             "record_type": entry.get("record_type", "pattern"),
@@ -201,10 +221,7 @@ def entry_to_record(entry: dict) -> dict:
             "recommended_action": entry.get("recommended_action", ""),
             "response": entry.get("response", ""),
             "original_question": question,
-            "logins": entry.get("logins", 0),
-            "support_cases": entry.get("support_cases", 0),
-            "defects": entry.get("defects", 0),
-            "feature_adoption": entry.get("feature_adoption", 0),
+            **metrics,
             **({"gql_id": entry["gql_id"]} if entry.get("gql_id") else {}),
             **({"gql_query": entry["gql_query"]} if entry.get("gql_query") else {}),
         },
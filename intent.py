@@ -35,9 +35,12 @@ _STOP_WORDS = frozenset({
 })
 
 
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+
+
 def preprocess(text: str) -> str:
     """Lowercase and strip punctuation for consistent BoW encoding."""
-    return re.sub(r"[^\w\s]", " ", text.lower()).strip()
+    return _NON_WORD_RE.sub(" ", text.lower()).strip()
 
 
 # ---------------------------------------------------------------------------
@@ -100,6 +103,12 @@ _PHRASE_MAP = {
     "fell off":          "dropped_off",
 }
 
+# Built once at import: longest phrases first so "power users" wins
+# over "power user" (which would leave a trailing 's').
+_PHRASES_LONGEST_FIRST = tuple(
+    sorted(_PHRASE_MAP.items(), key=lambda x: -len(x[0]))
+)
+
 
 def _apply_phrases(text: str) -> str:
     """Replace known multi-word phrases with underscore-joined tokens.
@@ -107,7 +116,7 @@ def _apply_phrases(text: str) -> str:
     Matches longest phrases first so "power users" is replaced before
     "power user" (which would leave a trailing 's').
     """
-    for phrase, token in sorted(_PHRASE_MAP.items(), key=lambda x: -len(x[0])):
+    for phrase, token in _PHRASES_LONGEST_FIRST:
         text = text.replace(phrase, token)
     return text
 
@@ -320,6 +329,18 @@ _DOMAIN_SYNONYMS: dict[str, list[str]] = {
 
 }
 
+# Synonym phrases flattened to stop-word-free words, in order, so expansion
+# walks one tuple per token instead of splitting phrases on every query.
+_SYNONYM_WORDS: dict[str, tuple[str, ...]] = {
+    token: tuple(dict.fromkeys(
+        word
+        for syn in synonyms
+        for word in syn.split()
+        if word not in _STOP_WORDS
+    ))
+    for token, synonyms in _DOMAIN_SYNONYMS.items()
+}
+
 
 def extract_keywords(text: str) -> str:
     """Extract content keywords from NL text, filtering stop words.
@@ -340,15 +361,14 @@ def extract_keywords(text: str) -> str:
 
     # Phase 3: expand domain synonyms (try raw token, then stemmed)
     expanded: list[str] = list(tokens)
+    seen = set(tokens)
     for token in tokens:
-        synonyms = _DOMAIN_SYNONYMS.get(token)
-        if not synonyms:
-            stemmed = _stem(token)
-            synonyms = _DOMAIN_SYNONYMS.get(stemmed)
-        if synonyms:
-            for syn in synonyms:
-                for word in syn.split():
-                    if word not in _STOP_WORDS and word not in expanded:
-                        expanded.append(word)
+        synonym_words = _SYNONYM_WORDS.get(token)
+        if synonym_words is None:
+            synonym_words = _SYNONYM_WORDS.get(_stem(token), ())
+        for word in synonym_words:
+            if word not in seen:
+                seen.add(word)
+                expanded.append(word)
 
     return " ".join(expanded)
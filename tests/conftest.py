@@ -13,6 +13,7 @@ if str(MODEL_DIR) not in sys.path:
 
 TESTS_DIR = Path(__file__).resolve().parent
 CONCEPTS_PATH = TESTS_DIR / "test-concepts.json"
+EXEMPLARS_PATH = MODEL_DIR / "data" / "exemplars.jsonl"
 
 
 @pytest.fixture(scope="session")
@@ -22,6 +23,13 @@ def test_customers():
         return json.load(f)["customers"]
 
 
+@pytest.fixture(scope="session")
+def exemplar_entries():
+    """Parse data/exemplars.jsonl once for every module that encodes it."""
+    with open(EXEMPLARS_PATH) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
 @pytest.fixture(scope="session")
 def encoder_config():
     """Import and return the model's ENCODER_CONFIG."""
@@ -29,6 +37,13 @@ def encoder_config():
     return ENCODER_CONFIG
 
 
+@pytest.fixture(scope="session")
+def encoder(encoder_config):
+    """Shared glyphh Encoder — builds the role vectors once per session."""
+    glyphh = pytest.importorskip("glyphh")
+    return glyphh.Encoder(encoder_config)
+
+
 @pytest.fixture(scope="session")
 def expected_high_risk(test_customers):
     """Customers we expect the model to classify as high risk."""
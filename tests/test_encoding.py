@@ -5,7 +5,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from encoder import ENCODER_CONFIG
+from encoder import ENCODER_CONFIG, LAYERS, ROLES
 
 
 def test_config_has_required_fields(encoder_config):
@@ -20,8 +20,7 @@ def test_semantic_layer_exists(encoder_config):
     layer_names = [l.name for l in encoder_config.layers]
     assert "semantic" in layer_names
 
-    semantic = next(l for l in encoder_config.layers if l.name == "semantic")
-    seg_names = [s.name for s in semantic.segments]
+    seg_names = [s.name for s in LAYERS["semantic"].segments]
     assert "identity" in seg_names
     assert "context" in seg_names
 
@@ -31,8 +30,7 @@ def test_metrics_layer_exists(encoder_config):
     layer_names = [l.name for l in encoder_config.layers]
     assert "metrics" in layer_names
 
-    metrics = next(l for l in encoder_config.layers if l.name == "metrics")
-    roles = metrics.segments[0].roles
+    roles = LAYERS["metrics"].segments[0].roles
     role_names = [r.name for r in roles]
     assert "logins" in role_names
     assert "support_cases" in role_names
@@ -40,23 +38,30 @@ def test_metrics_layer_exists(encoder_config):
     assert "feature_adoption" in role_names
 
 
-def test_customer_id_is_key_part(encoder_config):
+def test_customer_id_is_key_part():
     """customer_id must be the key_part role for temporal identity."""
-    semantic = next(l for l in encoder_config.layers if l.name == "semantic")
-    identity = next(s for s in semantic.segments if s.name == "identity")
-    cid_role = next(r for r in identity.roles if r.name == "customer_id")
-    assert cid_role.key_part is True
+    assert ROLES[("semantic", "identity", "customer_id")].key_part is True
 
 
-def test_numeric_roles_have_config(encoder_config):
+def test_numeric_roles_have_config():
     """All metric roles must have NumericConfig with THERMOMETER encoding."""
-    metrics = next(l for l in encoder_config.layers if l.name == "metrics")
-    for role in metrics.segments[0].roles:
+    for role in LAYERS["metrics"].segments[0].roles:
         assert role.numeric_config is not None, f"{role.name} missing numeric_config"
         assert role.numeric_config.bin_width > 0
         assert role.numeric_config.encoding_strategy.value == "thermometer"
 
 
+def test_lookup_indexes_cover_config(encoder_config):
+    """LAYERS and ROLES must index every layer and role in ENCODER_CONFIG."""
+    assert encoder_config is ENCODER_CONFIG
+    assert list(LAYERS) == [l.name for l in encoder_config.layers]
+    for layer in encoder_config.layers:
+        assert LAYERS[layer.name] is layer
+        for segment in layer.segments:
+            for role in segment.roles:
+                assert ROLES[(layer.name, segment.name, role.name)] is role
+
+
 def test_temporal_config(encoder_config):
     """Temporal source should be auto with auto signal type."""
     assert encoder_config.temporal_source == "auto"
@@ -11,15 +11,10 @@ from encoder import ENCODER_CONFIG
 
 glyphh = pytest.importorskip("glyphh")
 
-from glyphh import Encoder, Concept
+from glyphh import Concept
 from glyphh.core.ops import cosine_similarity
 
 
-@pytest.fixture(scope="module")
-def encoder():
-    return Encoder(ENCODER_CONFIG)
-
-
 def _make_customer(encoder, cid, logins=50, support=2, defects=1, adoption=50):
     """Encode a raw customer with specific metric values."""
     return encoder.encode(Concept(
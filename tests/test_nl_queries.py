@@ -9,7 +9,6 @@ NL query-to-exemplar matching uses the semantic layer.
 This file tests the semantic path.
 """
 
-import json
 import sys
 from pathlib import Path
 
@@ -17,39 +16,26 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from encoder import ENCODER_CONFIG, encode_query, entry_to_record
+from encoder import encode_query, entry_to_record
 
 glyphh = pytest.importorskip("glyphh")
 
-from glyphh import Encoder, Concept
+from glyphh import Concept
 from glyphh.core.ops import cosine_similarity
 
-DATA_DIR = Path(__file__).resolve().parent.parent / "data"
-
 
 @pytest.fixture(scope="module")
-def encoder():
-    return Encoder(ENCODER_CONFIG)
-
-
-@pytest.fixture(scope="module")
-def pattern_glyphs(encoder):
+def pattern_glyphs(encoder, exemplar_entries):
     """Encode all training exemplars into glyphs with their metadata."""
-    exemplars_path = DATA_DIR / "exemplars.jsonl"
     glyphs = []
-    with open(exemplars_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            entry = json.loads(line)
-            record = entry_to_record(entry)
-            concept = Concept(
-                name=record["concept_text"],
-                attributes=record["attributes"],
-            )
-            glyph = encoder.encode(concept)
-            glyphs.append((glyph, record["metadata"]))
+    for entry in exemplar_entries:
+        record = entry_to_record(entry)
+        concept = Concept(
+            name=record["concept_text"],
+            attributes=record["attributes"],
+        )
+        glyph = encoder.encode(concept)
+        glyphs.append((glyph, record["metadata"]))
     return glyphs
 
 
@@ -52,6 +52,16 @@ def test_query_has_stable_name():
     assert r1["name"] == r2["name"]
 
 
+def test_repeated_query_returns_independent_dicts():
+    """Cached queries must not share attribute dicts between callers."""
+    q = "customers with declining usage"
+    r1 = encode_query(q)
+    r1["attributes"]["customer_id"] = "mutated"
+    r2 = encode_query(q)
+    assert r2["attributes"]["customer_id"] == ""
+    assert r2["attributes"]["keywords"] == r1["attributes"]["keywords"]
+
+
 def test_query_has_no_numeric_values():
     """Queries should not contain numeric metric values — matching is text-driven."""
     result = encode_query("customers likely to churn")
@@ -9,7 +9,6 @@ customers have metrics but no text. The semantic layer drives NL query
 matching; the metrics layer drives customer data matching.
 """
 
-import json
 import sys
 from pathlib import Path
 
@@ -17,46 +16,41 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from encoder import ENCODER_CONFIG, entry_to_record
+from encoder import entry_to_record
 
 # These tests require the glyphh SDK
 glyphh = pytest.importorskip("glyphh")
 
-from glyphh import Encoder, Concept
-from glyphh.core.ops import cosine_similarity
-
-DATA_DIR = Path(__file__).resolve().parent.parent / "data"
-
-
-@pytest.fixture(scope="module")
-def encoder():
-    return Encoder(ENCODER_CONFIG)
+import numpy as np
+from glyphh import Concept
 
 
 @pytest.fixture(scope="module")
-def pattern_glyphs(encoder):
+def pattern_glyphs(encoder, exemplar_entries):
     """Encode all training exemplars into glyphs with their metadata."""
-    exemplars_path = DATA_DIR / "exemplars.jsonl"
     glyphs = []
-    with open(exemplars_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            entry = json.loads(line)
-            # Skip semantic-only exemplars (no meaningful metrics)
-            if entry.get("risk_level") == "all":
-                continue
-            record = entry_to_record(entry)
-            concept = Concept(
-                name=record["concept_text"],
-                attributes=record["attributes"],
-            )
-            glyph = encoder.encode(concept)
-            glyphs.append((glyph, record["metadata"]))
+    for entry in exemplar_entries:
+        # Skip semantic-only exemplars (no meaningful metrics)
+        if entry.get("risk_level") == "all":
+            continue
+        record = entry_to_record(entry)
+        concept = Concept(
+            name=record["concept_text"],
+            attributes=record["attributes"],
+        )
+        glyph = encoder.encode(concept)
+        glyphs.append((glyph, record["metadata"]))
     return glyphs
 
 
+@pytest.fixture(scope="module")
+def pattern_matrix(pattern_glyphs):
+    """Metrics layer vectors of pattern_glyphs stacked into one (P, D) matrix."""
+    return np.stack(
+        [g.layers["metrics"].cortex.data for g, _ in pattern_glyphs]
+    ).astype(np.int32)
+
+
 def _encode_customer(customer, encoder):
     """Encode a raw customer record (metrics only) into a glyph."""
     return encoder.encode(Concept(
@@ -73,35 +67,45 @@ def _encode_customer(customer, encoder):
     ))
 
 
-def _metrics_score(glyph1, glyph2):
-    """Cosine similarity on metrics layer cortex vectors.
+@pytest.fixture(scope="module")
+def encoded_customers(encoder, expected_high_risk, expected_low_risk):
+    """Glyphs for the labelled test customers, keyed by expected risk then id.
+
+    Encoded once per module. A customer whose _expected_risk label changes
+    is no longer found under its old level, so the lookup fails loudly.
+    """
+    return {
+        level: {c["customer_id"]: _encode_customer(c, encoder) for c in customers}
+        for level, customers in (
+            ("high", expected_high_risk),
+            ("low", expected_low_risk),
+        )
+    }
 
-    Customer matching is metrics-driven (customers have data, no text).
+
+def _metrics_scores(glyph, pattern_matrix):
+    """Metrics layer cosine similarity of a glyph against every matrix row.
+
+    Vectors are bipolar, so cosine is dot / dimension — the same formula as
+    glyphh's cosine_similarity, computed for every pattern in one product.
     """
-    v1 = glyph1.layers["metrics"].cortex.data
-    v2 = glyph2.layers["metrics"].cortex.data
-    return float(cosine_similarity(v1, v2))
+    v = glyph.layers["metrics"].cortex.data.astype(np.int32)
+    return pattern_matrix @ v / v.shape[0]
 
 
-def _find_best_match(customer_glyph, pattern_glyphs):
+def _find_best_match(customer_glyph, pattern_glyphs, pattern_matrix):
     """Find the training exemplar most similar to a customer glyph."""
-    best_score = -1
-    best_meta = None
-    for pattern_glyph, meta in pattern_glyphs:
-        score = _metrics_score(customer_glyph, pattern_glyph)
-        if score > best_score:
-            best_score = score
-            best_meta = meta
-    return best_meta, best_score
+    scores = _metrics_scores(customer_glyph, pattern_matrix)
+    best = int(scores.argmax())
+    return pattern_glyphs[best][1], float(scores[best])
 
 
 def test_inactive_customer_matches_high_risk(
-    encoder, pattern_glyphs, expected_high_risk
+    encoded_customers, pattern_glyphs, pattern_matrix
 ):
     """acme-corp (0 logins, 0 everything) should match high-risk exemplars."""
-    acme = next(c for c in expected_high_risk if c["customer_id"] == "acme-corp")
-    glyph = _encode_customer(acme, encoder)
-    meta, score = _find_best_match(glyph, pattern_glyphs)
+    glyph = encoded_customers["high"]["acme-corp"]
+    meta, score = _find_best_match(glyph, pattern_glyphs, pattern_matrix)
 
     assert meta["risk_level"] == "high", (
         f"acme-corp matched {meta['risk_level']} (score={score:.4f}), expected high"
@@ -109,12 +113,11 @@ def test_inactive_customer_matches_high_risk(
 
 
 def test_support_heavy_customer_matches_high_risk(
-    encoder, pattern_glyphs, expected_high_risk
+    encoded_customers, pattern_glyphs, pattern_matrix
 ):
     """beta-inc (18 support cases) should match high-risk exemplars."""
-    beta = next(c for c in expected_high_risk if c["customer_id"] == "beta-inc")
-    glyph = _encode_customer(beta, encoder)
-    meta, score = _find_best_match(glyph, pattern_glyphs)
+    glyph = encoded_customers["high"]["beta-inc"]
+    meta, score = _find_best_match(glyph, pattern_glyphs, pattern_matrix)
 
     assert meta["risk_level"] == "high", (
         f"beta-inc matched {meta['risk_level']} (score={score:.4f}), expected high"
@@ -122,12 +125,11 @@ def test_support_heavy_customer_matches_high_risk(
 
 
 def test_defect_heavy_customer_matches_high_risk(
-    encoder, pattern_glyphs, expected_high_risk
+    encoded_customers, pattern_glyphs, pattern_matrix
 ):
     """gamma-llc (9 defects, declining) should match high-risk exemplars."""
-    gamma = next(c for c in expected_high_risk if c["customer_id"] == "gamma-llc")
-    glyph = _encode_customer(gamma, encoder)
-    meta, score = _find_best_match(glyph, pattern_glyphs)
+    glyph = encoded_customers["high"]["gamma-llc"]
+    meta, score = _find_best_match(glyph, pattern_glyphs, pattern_matrix)
 
     assert meta["risk_level"] == "high", (
         f"gamma-llc matched {meta['risk_level']} (score={score:.4f}), expected high"
@@ -135,12 +137,11 @@ def test_defect_heavy_customer_matches_high_risk(
 
 
 def test_power_user_matches_low_risk(
-    encoder, pattern_glyphs, expected_low_risk
+    encoded_customers, pattern_glyphs, pattern_matrix
 ):
     """omega-ai (150 logins, 95% adoption) should match low-risk exemplars."""
-    omega = next(c for c in expected_low_risk if c["customer_id"] == "omega-ai")
-    glyph = _encode_customer(omega, encoder)
-    meta, score = _find_best_match(glyph, pattern_glyphs)
+    glyph = encoded_customers["low"]["omega-ai"]
+    meta, score = _find_best_match(glyph, pattern_glyphs, pattern_matrix)
 
     assert meta["risk_level"] == "low", (
         f"omega-ai matched {meta['risk_level']} (score={score:.4f}), expected low"
@@ -148,12 +149,11 @@ def test_power_user_matches_low_risk(
 
 
 def test_expanding_customer_matches_low_risk(
-    encoder, pattern_glyphs, expected_low_risk
+    encoded_customers, pattern_glyphs, pattern_matrix
 ):
     """sigma-dev (110 logins, 80% adoption) should match low-risk exemplars."""
-    sigma = next(c for c in expected_low_risk if c["customer_id"] == "sigma-dev")
-    glyph = _encode_customer(sigma, encoder)
-    meta, score = _find_best_match(glyph, pattern_glyphs)
+    glyph = encoded_customers["low"]["sigma-dev"]
+    meta, score = _find_best_match(glyph, pattern_glyphs, pattern_matrix)
 
     assert meta["risk_level"] == "low", (
         f"sigma-dev matched {meta['risk_level']} (score={score:.4f}), expected low"
@@ -161,21 +161,18 @@ def test_expanding_customer_matches_low_risk(
 
 
 def test_high_risk_scores_higher_than_low_risk(
-    encoder, pattern_glyphs, expected_high_risk, expected_low_risk
+    encoded_customers, pattern_glyphs, pattern_matrix
 ):
     """High-risk customers should have stronger matches to high-risk exemplars
     than low-risk customers do."""
-    acme = next(c for c in expected_high_risk if c["customer_id"] == "acme-corp")
-    omega = next(c for c in expected_low_risk if c["customer_id"] == "omega-ai")
-
-    acme_glyph = _encode_customer(acme, encoder)
-    omega_glyph = _encode_customer(omega, encoder)
+    acme_glyph = encoded_customers["high"]["acme-corp"]
+    omega_glyph = encoded_customers["low"]["omega-ai"]
 
     # Get their best match scores against high-risk exemplars only
-    high_exemplars = [(g, m) for g, m in pattern_glyphs if m["risk_level"] == "high"]
+    high_rows = pattern_matrix[[m["risk_level"] == "high" for _, m in pattern_glyphs]]
 
-    acme_best = max(_metrics_score(acme_glyph, pg) for pg, _ in high_exemplars)
-    omega_best = max(_metrics_score(omega_glyph, pg) for pg, _ in high_exemplars)
+    acme_best = float(_metrics_scores(acme_glyph, high_rows).max())
+    omega_best = float(_metrics_scores(omega_glyph, high_rows).max())
 
     assert acme_best > omega_best, (
         f"acme-corp ({acme_best:.4f}) should score higher against high-risk "
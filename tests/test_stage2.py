@@ -13,35 +13,27 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from encoder import ENCODER_CONFIG, entry_to_record
+from encoder import entry_to_record
 
 glyphh = pytest.importorskip("glyphh")
 
-from glyphh import Encoder, Concept
+from glyphh import Concept
 from glyphh.core.ops import cosine_similarity
 
-DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 DEMO_DIR = Path(__file__).resolve().parent.parent / "demo"
 
 
 @pytest.fixture(scope="module")
-def encoder():
-    return Encoder(ENCODER_CONFIG)
-
-
-@pytest.fixture(scope="module")
-def exemplar_glyphs(encoder):
+def exemplar_glyphs(encoder, exemplar_entries):
     """Encode exemplars, keyed by question text."""
     result = {}
-    with open(DATA_DIR / "exemplars.jsonl") as f:
-        for line in f:
-            entry = json.loads(line.strip())
-            if entry.get("risk_level") == "all":
-                continue
-            record = entry_to_record(entry)
-            concept = Concept(name=record["concept_text"], attributes=record["attributes"])
-            glyph = encoder.encode(concept)
-            result[entry["question"]] = (entry, glyph)
+    for entry in exemplar_entries:
+        if entry.get("risk_level") == "all":
+            continue
+        record = entry_to_record(entry)
+        concept = Concept(name=record["concept_text"], attributes=record["attributes"])
+        glyph = encoder.encode(concept)
+        result[entry["question"]] = (entry, glyph)
     return result
 
 
@@ -7,16 +7,12 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from encoder import ENCODER_CONFIG
+from encoder import ENCODER_CONFIG, ROLES
 
 glyphh = pytest.importorskip("glyphh")
 
-from glyphh import Encoder, Concept
-
-
-@pytest.fixture(scope="module")
-def encoder():
-    return Encoder(ENCODER_CONFIG)
+import numpy as np
+from glyphh import Concept
 
 
 def test_same_customer_different_metrics_different_glyphs(encoder, test_customers):
@@ -52,15 +48,12 @@ def test_same_customer_different_metrics_different_glyphs(encoder, test_customer
     ))
 
     # Vectors should differ because metrics changed
-    assert glyph_day1.global_cortex.data.tolist() != glyph_day2.global_cortex.data.tolist()
+    assert not np.array_equal(glyph_day1.global_cortex.data, glyph_day2.global_cortex.data)
 
 
 def test_customer_id_is_key_part():
     """Verify customer_id is marked as key_part in the config."""
-    semantic = next(l for l in ENCODER_CONFIG.layers if l.name == "semantic")
-    identity = next(s for s in semantic.segments if s.name == "identity")
-    cid = next(r for r in identity.roles if r.name == "customer_id")
-    assert cid.key_part is True
+    assert ROLES[("semantic", "identity", "customer_id")].key_part is True
 
 
 def test_temporal_source_is_auto():